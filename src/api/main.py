@@ -4,14 +4,17 @@
 REST API 서버 및 라우팅 설정
 """
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 import time
 from datetime import datetime
 
 from src.core.config import get_settings
 from src.core.logging_config import get_logger
+from src.services.exchange_service import exchange_service
+from src.services.ai_inference_service import ai_service
 from src.api.routes.simulation import router as simulation_router
 from src.api.routes.monitoring import router as monitoring_router
 
@@ -19,6 +22,14 @@ from src.api.routes.monitoring import router as monitoring_router
 logger = get_logger(__name__)
 settings = get_settings()
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 수명주기 관리"""
+    yield
+    # 종료 시 거래소 연결 및 AI 서비스 정리
+    await exchange_service.close()
+    ai_service.close()
+
 def create_app() -> FastAPI:
     """FastAPI 애플리케이션 생성 및 설정"""
     
@@ -27,7 +38,9 @@ def create_app() -> FastAPI:
         description="실시간 암호화폐 트레이딩 시뮬레이션 & 백테스팅 플랫폼",
         version="1.0.0",
         docs_url="/docs" if settings.debug else None,
-        redoc_url="/redoc" if settings.debug else None
+        redoc_url="/redoc" if settings.debug else None,
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan
     )
     
     # CORS 미들웨어 설정
@@ -45,13 +58,14 @@ def create_app() -> FastAPI:
         start_time = time.time()
         
         # 요청 로깅
-        logger.info(f"📥 {request.method} {request.url.path}")
+        # loguru 지연 포맷팅 - 레벨이 꺼져 있으면 문자열을 만들지 않음
+        logger.info("📥 {} {}", request.method, request.url.path)
         
         response = await call_next(request)
         
         # 응답 시간 계산
         process_time = time.time() - start_time
-        logger.info(f"📤 {request.method} {request.url.path} - {response.status_code} ({process_time:.3f}s)")
+        logger.info("📤 {} {} - {} ({:.3f}s)", request.method, request.url.path, response.status_code, process_time)
         
         return response
     
@@ -5,15 +5,18 @@
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import Dict, List, Optional
 from datetime import datetime
+import asyncio
 import pandas as pd
 
 from src.services.ai_inference_service import ai_service
-from src.services.exchange_service import exchange_service
+from src.services.exchange_service import exchange_service, as_df
 from src.core.logging_config import get_logger
 
+# 응답은 ORJSONResponse로 직접 반환 (jsonable_encoder 단계 생략, numpy 스칼라 직렬화)
 router = APIRouter(prefix="/api/v1/ai", tags=["ai_analysis"])
 logger = get_logger(__name__)
 
@@ -27,11 +30,11 @@ async def analyze_market_sentiment(symbol: str):
     """시장 심리 분석"""
     try:
         sentiment = await ai_service.analyze_market_sentiment(symbol)
-        return {
+        return ORJSONResponse({
             "symbol": symbol,
             "sentiment": sentiment,
             "timestamp": datetime.now().isoformat()
-        }
+        })
     except Exception as e:
         logger.error(f"심리 분석 오류: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -41,22 +44,22 @@ async def predict_price_direction(request: AnalysisRequest):
     """가격 방향 예측"""
     try:
         # 과거 데이터 조회
-        ohlcv_data = await exchange_service.get_ohlcv_data(
+        ohlcv_arrays = await exchange_service.get_ohlcv_arrays(
             request.symbol, request.timeframe, request.days
         )
         
-        if not ohlcv_data:
+        if not len(ohlcv_arrays['close']):
             raise HTTPException(status_code=400, detail="시장 데이터를 가져올 수 없습니다")
         
-        df = pd.DataFrame(ohlcv_data)
+        df = as_df(ohlcv_arrays)
         prediction = await ai_service.predict_price_direction(df, request.symbol)
         
-        return {
+        return ORJSONResponse({
             "symbol": request.symbol,
             "prediction": prediction,
             "timeframe": request.timeframe,
             "timestamp": datetime.now().isoformat()
-        }
+        })
     except Exception as e:
         logger.error(f"가격 예측 오류: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -65,16 +68,16 @@ async def predict_price_direction(request: AnalysisRequest):
 async def recommend_trading_strategy(request: AnalysisRequest):
     """거래 전략 추천"""
     try:
-        # 시장 데이터 수집
-        market_data = await exchange_service.get_real_trading_data(
-            request.symbol, request.days * 24
+        # 시장 데이터 수집과 심리 분석은 서로 독립적이므로 동시 실행
+        market_data, sentiment = await asyncio.gather(
+            exchange_service.get_real_trading_data(request.symbol, request.days * 24),
+            ai_service.analyze_market_sentiment(request.symbol)
         )
         
         if not market_data:
             raise HTTPException(status_code=400, detail="시장 데이터를 가져올 수 없습니다")
         
         # AI 분석
-        sentiment = await ai_service.analyze_market_sentiment(request.symbol)
         df = pd.DataFrame(market_data['historical_data'])
         prediction = await ai_service.predict_price_direction(df, request.symbol)
         
@@ -83,7 +86,7 @@ async def recommend_trading_strategy(request: AnalysisRequest):
             request.symbol, market_data, sentiment, prediction
         )
         
-        return {
+        return ORJSONResponse({
             "symbol": request.symbol,
             "strategy": strategy,
             "market_analysis": {
@@ -91,7 +94,7 @@ async def recommend_trading_strategy(request: AnalysisRequest):
                 "prediction": prediction
             },
             "timestamp": datetime.now().isoformat()
-        }
+        })
     except Exception as e:
         logger.error(f"전략 추천 오류: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -100,18 +103,18 @@ async def recommend_trading_strategy(request: AnalysisRequest):
 async def get_technical_indicators(symbol: str, timeframe: str = "1d", limit: int = 100):
     """기술적 지표 분석"""
     try:
-        ohlcv_data = await exchange_service.get_ohlcv_data(symbol, timeframe, limit)
+        ohlcv_arrays = await exchange_service.get_ohlcv_arrays(symbol, timeframe, limit)
         
-        if not ohlcv_data:
+        if not len(ohlcv_arrays['close']):
             raise HTTPException(status_code=400, detail="시장 데이터를 가져올 수 없습니다")
         
-        indicators = await ai_service.calculate_technical_indicators(ohlcv_data)
+        indicators = await ai_service.calculate_technical_indicators(ohlcv_arrays)
         
-        return {
+        return ORJSONResponse({
             "symbol": symbol,
             "indicators": indicators,
             "timestamp": datetime.now().isoformat()
-        }
+        })
     except Exception as e:
         logger.error(f"기술적 지표 계산 오류: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -122,12 +125,12 @@ async def assess_trading_risk(symbol: str, investment_amount: float = 1000000):
     try:
         risk_assessment = await ai_service.assess_trading_risk(symbol, investment_amount)
         
-        return {
+        return ORJSONResponse({
             "symbol": symbol,
             "investment_amount": investment_amount,
             "risk_assessment": risk_assessment,
             "timestamp": datetime.now().isoformat()
-        }
+        })
     except Exception as e:
         logger.error(f"리스크 평가 오류: {e}")
         raise HTTPException(status_code=500, detail=str(e))
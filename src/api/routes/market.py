@@ -6,7 +6,6 @@
 
 from fastapi import APIRouter, HTTPException, Query
 from typing import Optional, List
-import asyncio
 from datetime import datetime, timedelta
 
 from src.services.exchange_service import exchange_service
@@ -147,19 +146,10 @@ async def get_multi_price(
     """여러 심볼 동시 시세 조회"""
     try:
         symbol_list = [s.strip() for s in symbols.split(",")]
-        results = {}
-        
-        tasks = []
-        for symbol in symbol_list:
-            tasks.append(exchange_service.get_current_price(symbol, exchange))
-        
-        prices = await asyncio.gather(*tasks, return_exceptions=True)
         
-        for symbol, price in zip(symbol_list, prices):
-            if isinstance(price, Exception):
-                results[symbol] = {"error": str(price)}
-            else:
-                results[symbol] = {"price": price}
+        # 한 번의 일괄 시세 요청으로 조회
+        prices = await exchange_service.get_current_prices(symbol_list, exchange)
+        results = {symbol: {"price": price} for symbol, price in prices.items()}
         
         return {
             "exchange": exchange,
@@ -246,19 +236,17 @@ async def get_market_summary():
     """시장 전체 요약"""
     try:
         symbols = ["BTC/KRW", "ETH/KRW", "XRP/KRW", "ADA/KRW"]
-        summary = []
+        prices = await exchange_service.get_current_prices(symbols)
         
-        for symbol in symbols:
-            try:
-                price = await exchange_service.get_current_price(symbol)
-                if price:
-                    summary.append({
-                        "symbol": symbol,
-                        "price": price,
-                        "change_24h": 0.0  # 실제 구현 시 24시간 변화율 계산
-                    })
-            except:
-                continue
+        summary = [
+            {
+                "symbol": symbol,
+                "price": price,
+                "change_24h": 0.0  # 실제 구현 시 24시간 변화율 계산
+            }
+            for symbol, price in prices.items()
+            if price
+        ]
         
         return {
             "market_summary": summary,
@@ -3,7 +3,7 @@
 🎯 시뮬레이션 관련 API 라우트 - 실제 데이터 & AI 통합
 """
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Query
 from pydantic import BaseModel
 from typing import Optional, Dict, Any, List
 import uuid
@@ -11,6 +11,7 @@ import asyncio
 from datetime import datetime, timedelta
 import random
 import time
+import numpy as np
 import pandas as pd
 
 from src.services.exchange_service import exchange_service
@@ -66,10 +67,10 @@ async def start_simulation(request: SimulationRequest):
     simulation_id = str(uuid.uuid4())
     
     try:
-        # 실제 시장 데이터 가져오기
-        market_data = await exchange_service.get_real_trading_data(
-            request.symbol, 
-            request.duration_hours
+        # 실제 시장 데이터와 시장 심리는 서로 독립적이므로 동시 조회
+        market_data, sentiment = await asyncio.gather(
+            exchange_service.get_real_trading_data(request.symbol, request.duration_hours),
+            ai_service.analyze_market_sentiment(request.symbol)
         )
         
         if not market_data:
@@ -77,7 +78,6 @@ async def start_simulation(request: SimulationRequest):
         
         # AI 시장 분석
         historical_df = pd.DataFrame(market_data['historical_data'])
-        sentiment = await ai_service.analyze_market_sentiment(request.symbol)
         prediction = await ai_service.predict_price_direction(historical_df, request.symbol)
         strategy = await ai_service.generate_trading_strategy(
             request.symbol, market_data, sentiment, prediction
@@ -126,8 +126,16 @@ async def start_simulation(request: SimulationRequest):
         raise HTTPException(status_code=500, detail=f"시뮬레이션 시작 실패: {str(e)}")
 
 @router.get("/status/{simulation_id}")
-async def get_simulation_status(simulation_id: str):
-    """AI 기반 실시간 시뮬레이션 상태 조회"""
+async def get_simulation_status(
+    simulation_id: str,
+    since: Optional[int] = Query(default=None, ge=0, description="이미 받은 거래 기록 수"),
+    buckets: Optional[int] = Query(default=None, ge=1, le=10000, description="잔고 차트 구간 수")
+):
+    """AI 기반 실시간 시뮬레이션 상태 조회
+    
+    since를 주면 그 위치 이후의 거래 기록만 보내고 과거 시장 데이터는 생략 (폴링용 증분 응답)
+    buckets를 주면 잔고 곡선을 구간별 시가/고가/저가/종가로 집계해 chart로 함께 전송
+    """
     if simulation_id not in active_simulations:
         raise HTTPException(status_code=404, detail="시뮬레이션을 찾을 수 없습니다")
     
@@ -190,7 +198,19 @@ async def get_simulation_status(simulation_id: str):
         else:
             sim["status"] = "completed"
     
-    return sim
+    # 거래 기록 기반 성과 지표 (벡터화 계산 - 저장된 시뮬레이션 기록은 바꾸지 않고 응답에만 포함)
+    trades = sim["trades"]
+    balances = np.fromiter((t["balance"] for t in trades), dtype=np.float64, count=len(trades))
+    response = dict(sim)
+    response.update(calculate_equity_metrics(sim["initial_balance"], balances))
+    
+    if since is not None:
+        del response["market_data"]
+        response["trades"] = trades[since:]
+        response["trades_since"] = since
+    if buckets is not None:
+        response["chart"] = bucket_equity_curve([t["timestamp"] for t in trades], balances, buckets)
+    return response
 
 @router.delete("/{simulation_id}")
 async def stop_simulation(simulation_id: str):
@@ -397,6 +417,47 @@ def calculate_sharpe_ratio(daily_balance: List[Dict]) -> float:
     
     return (avg_return / return_std) * (252 ** 0.5) if return_std > 0 else 0.0  # 연환산
 
+def calculate_equity_metrics(initial_balance: float, balances: np.ndarray) -> Dict[str, float]:
+    """잔고 곡선 기반 최대 낙폭 및 거래당 샤프 비율 계산
+    
+    거래 간격이 일정하지 않으므로 샤프 비율은 연환산하지 않은 거래 단위 값
+    (거래당 평균 수익률 / 표준편차)이다.
+    """
+    equity = np.concatenate(([initial_balance], balances))
+    
+    # 최대 낙폭 (고점 대비 하락률)
+    peak = np.maximum.accumulate(equity)
+    drawdown = (equity - peak) / peak
+    
+    # 샤프 비율 (거래 단위 수익률 기준, 연환산하지 않음)
+    returns = np.diff(equity) / equity[:-1]
+    return_std = returns.std(ddof=1) if returns.size > 1 else 0.0
+    sharpe_ratio = float(returns.mean() / return_std) if return_std > 0 else 0.0
+    
+    return {
+        "max_drawdown": float(abs(drawdown.min()) * 100),
+        "sharpe_ratio_per_trade": sharpe_ratio
+    }
+
+def bucket_equity_curve(timestamps: List[str], balances: np.ndarray, buckets: int) -> Dict[str, List]:
+    """잔고 곡선을 구간별 시가/고가/저가/종가로 집계 (차트 폭 크기로 축소해 전송량 절감)"""
+    n = balances.size
+    if n == 0:
+        return {"t": [], "o": [], "h": [], "l": [], "c": []}
+    
+    # 거래 수가 같은 구간으로 분할 (구간 수 ≤ 거래 수이므로 빈 구간 없음)
+    k = min(buckets, n)
+    starts = np.arange(k) * n // k
+    ends = np.append(starts[1:], n) - 1
+    
+    return {
+        "t": [timestamps[i] for i in starts],
+        "o": balances[starts].tolist(),
+        "h": np.maximum.reduceat(balances, starts).tolist(),
+        "l": np.minimum.reduceat(balances, starts).tolist(),
+        "c": balances[ends].tolist()
+    }
+
 def calculate_volatility(balances: List[float]) -> float:
     """변동성 계산"""
     if len(balances) < 2:
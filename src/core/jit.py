@@ -0,0 +1,19 @@
+"""
+⚡ JIT 컴파일 호환 레이어
+numba 미설치 환경에서도 동일한 코드가 동작하도록 no-op 데코레이터 제공
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """numba.njit 대체 데코레이터 (순수 Python으로 실행)"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
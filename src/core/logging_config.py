@@ -6,6 +6,7 @@
 
 import sys
 import logging
+from functools import lru_cache
 from pathlib import Path
 from loguru import logger
 from datetime import datetime
@@ -63,8 +64,9 @@ def setup_logging():
     
     logger.info("✅ 로깅 시스템 초기화 완료")
 
+@lru_cache(maxsize=256)
 def get_logger(name: str):
-    """로거 인스턴스 반환"""
+    """로거 인스턴스 반환 (이름별로 동일한 바인딩 로거 재사용)"""
     return logger.bind(name=name)
 
 def log_trade(trade_type: str, symbol: str, message: str):
@@ -83,11 +85,11 @@ def log_performance(func):
         try:
             result = await func(*args, **kwargs)
             execution_time = time.time() - start_time
-            logger.info(f"⚡ {func.__name__} 실행 완료 - {execution_time:.2f}초")
+            logger.info("⚡ {} 실행 완료 - {:.2f}초", func.__name__, execution_time)
             return result
         except Exception as e:
             execution_time = time.time() - start_time
-            logger.error(f"❌ {func.__name__} 실행 실패 - {execution_time:.2f}초 - 오류: {e}")
+            logger.error("❌ {} 실행 실패 - {:.2f}초 - 오류: {}", func.__name__, execution_time, e)
             raise
     
     @functools.wraps(func)
@@ -96,11 +98,11 @@ def log_performance(func):
         try:
             result = func(*args, **kwargs)
             execution_time = time.time() - start_time
-            logger.info(f"⚡ {func.__name__} 실행 완료 - {execution_time:.2f}초")
+            logger.info("⚡ {} 실행 완료 - {:.2f}초", func.__name__, execution_time)
             return result
         except Exception as e:
             execution_time = time.time() - start_time
-            logger.error(f"❌ {func.__name__} 실행 실패 - {execution_time:.2f}초 - 오류: {e}")
+            logger.error("❌ {} 실행 실패 - {:.2f}초 - 오류: {}", func.__name__, execution_time, e)
             raise
     
     if asyncio.iscoroutinefunction(func):
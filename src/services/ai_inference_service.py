@@ -4,20 +4,138 @@
 머신러닝 기반 시장 분석, 가격 예측, 전략 생성
 """
 
+import os
+import time
+import asyncio
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-import random
+from typing import Dict, List, Optional, Any, Tuple
+from types import MappingProxyType
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.preprocessing import StandardScaler
-import ta
 
 from src.core.logging_config import get_logger
 from src.core.config import get_settings
+from src.core.jit import njit, NUMBA_AVAILABLE
+from src.services.technical_indicators import (
+    technical_indicators, ohlcv_to_arrays, indicators_worker
+)
 
 logger = get_logger(__name__)
 
+# 심리/예측 점수 변환 테이블
+_SENTIMENT_SCORE = MappingProxyType({
+    "매우_낙관적": 0.9,
+    "낙관적": 0.6,
+    "중립": 0.0,
+    "비관적": -0.6,
+    "매우_비관적": -0.9
+})
+
+_PREDICTION_SCORE = MappingProxyType({
+    "강한_상승": 0.9,
+    "상승": 0.6,
+    "중립": 0.0,
+    "하락": -0.6,
+    "강한_하락": -0.9
+})
+
+# 예측 방향별 예상 변동률 범위 (%)
+_EXPECTED_CHANGE_RANGE = MappingProxyType({
+    "강한_상승": (5, 15),
+    "상승": (1, 5),
+    "중립": (-1, 1),
+    "하락": (-5, -1),
+    "강한_하락": (-15, -5)
+})
+
+# ISO 타임스탬프 캐시 (100ms 단위로 갱신)
+_ts_cache = ['', 0.0]
+
+def _iso_now() -> str:
+    """현재 시각 ISO 문자열 (100ms 이내 호출은 같은 문자열 재사용)"""
+    now = time.time()
+    if now - _ts_cache[1] > 0.1:
+        _ts_cache[0] = datetime.fromtimestamp(now).isoformat()
+        _ts_cache[1] = now
+    return _ts_cache[0]
+
+def _direction_from_change(change: float) -> str:
+    """예상 변동률(%)을 예측 방향으로 변환"""
+    if change > 5:
+        return "강한_상승"
+    if change > 1:
+        return "상승"
+    if change >= -1:
+        return "중립"
+    if change >= -5:
+        return "하락"
+    return "강한_하락"
+
+# 행동별 손절/익절 방향 (대기는 현재가 유지)
+_SIGN = MappingProxyType({"매수": 1.0, "매도": -1.0})
+
+# 시뮬레이션 분포 (라벨, 누적 확률)
+_SENTIMENT_LABELS = ("매우_낙관적", "낙관적", "중립", "비관적", "매우_비관적")
+_SENTIMENT_CUM_WEIGHTS = (0.15, 0.40, 0.70, 0.90, 1.00)
+
+_DIRECTION_LABELS = ("강한_상승", "상승", "중립", "하락", "강한_하락")
+_DIRECTION_CUM_PROBABILITIES = (0.15, 0.40, 0.70, 0.95, 1.00)
+
+_HOURLY_LABELS = ("상승", "중립", "하락")
+_HOURLY_CUM_PROBABILITIES = np.array([0.4, 0.7, 1.0])
+
+# 종합 점수 구간별 전략 (행동, 전략 유형, 포지션 크기)
+_STRATEGY_SELL_THRESHOLDS = (-0.6, -0.3)
+_STRATEGY_BUY_THRESHOLDS = (0.3, 0.6)
+_STRATEGY_TABLE = (
+    ("매도", "적극매도", 0.8),
+    ("매도", "부분매도", 0.3),
+    ("대기", "관망", 0.0),
+    ("매수", "부분매수", 0.4),
+    ("매수", "적극매수", 0.7)
+)
+
+# 리스크 점수 구간별 등급
+_RISK_THRESHOLDS = (0.3, 0.6, 0.8)
+_RISK_LEVELS = ("낮음", "보통", "높음", "매우높음")
+
+@njit(cache=True, fastmath=True)
+def _features_kernel(close: np.ndarray, volume: np.ndarray):
+    """가격 변화율, 거래량 비율, 수익률 변동성을 단일 루프로 계산"""
+    n = close.shape[0]
+    
+    # 가격 관련 특성
+    price_change = (close[n - 1] - close[n - 5]) / close[n - 5]
+    
+    # 거래량 특성
+    volume_mean = 0.0
+    for i in range(n):
+        volume_mean += volume[i]
+    volume_mean /= n
+    volume_ratio = volume[n - 1] / volume_mean
+    
+    # 변동성 (수익률 표본 표준편차, Welford 단일 패스)
+    mean = 0.0
+    m2 = 0.0
+    count = 0
+    for i in range(1, n):
+        ret = (close[i] - close[i - 1]) / close[i - 1]
+        count += 1
+        delta = ret - mean
+        mean += delta / count
+        m2 += delta * (ret - mean)
+    volatility = np.sqrt(m2 / (count - 1)) if count > 1 else np.nan
+    
+    return price_change, volume_ratio, volatility
+
+# 첫 요청에서 JIT 컴파일 비용이 발생하지 않도록 임포트 시 미리 컴파일
+if NUMBA_AVAILABLE:
+    _features_kernel(np.ones(20), np.ones(20))
+
 class AIInferenceService:
     """AI 추론 서비스"""
     
@@ -25,6 +143,8 @@ class AIInferenceService:
         self.settings = get_settings()
         self.models = {}
         self.scalers = {}
+        self._rng = np.random.default_rng()
+        self._pool: Optional[ProcessPoolExecutor] = None  # 첫 배치 요청 시 생성
         self._initialize_models()
     
     def _initialize_models(self):
@@ -53,20 +173,38 @@ class AIInferenceService:
         except Exception as e:
             logger.error(f"AI 모델 초기화 오류: {e}")
     
+    def close(self):
+        """종료 처리 - 프로세스 풀 정리"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+    
+    def _scale_features(self, X: np.ndarray) -> np.ndarray:
+        """학습된 통계로 특성 변환 (추론 요청은 스케일러 통계를 바꾸지 않음 - 미학습 시 그대로 반환)"""
+        scaler = self.scalers['features']
+        if not hasattr(scaler, 'mean_'):
+            return X
+        
+        try:
+            return scaler.transform(X)
+        except Exception as e:
+            logger.error(f"특성 스케일링 오류: {e}")
+            return X
+    
     async def analyze_market_sentiment(self, symbol: str) -> Dict[str, Any]:
         """시장 심리 분석"""
         try:
             # 시뮬레이션용 심리 분석
-            sentiments = ["매우_낙관적", "낙관적", "중립", "비관적", "매우_비관적"]
-            weights = [0.15, 0.25, 0.3, 0.2, 0.1]  # 가중치
+            # 필요한 난수를 한 번에 생성
+            u = self._rng.random(8).tolist()  # 응답 값이 numpy 스칼라가 아닌 float가 되도록 변환
             
-            sentiment = np.random.choice(sentiments, p=weights)
-            confidence = random.uniform(0.6, 0.95)
+            sentiment = _SENTIMENT_LABELS[bisect_right(_SENTIMENT_CUM_WEIGHTS, u[0])]
+            confidence = 0.6 + 0.35 * u[1]
             
             # 추가 분석 지표
-            fear_greed_index = random.uniform(0, 100)
-            social_volume = random.uniform(1000, 50000)
-            news_sentiment = random.uniform(-1, 1)
+            fear_greed_index = 100 * u[2]
+            social_volume = 1000 + 49000 * u[3]
+            news_sentiment = -1 + 2 * u[4]
             
             return {
                 "sentiment": sentiment,
@@ -74,11 +212,11 @@ class AIInferenceService:
                 "fear_greed_index": fear_greed_index,
                 "social_volume": social_volume,
                 "news_sentiment": news_sentiment,
-                "analysis_time": datetime.now().isoformat(),
+                "analysis_time": _iso_now(),
                 "factors": {
-                    "technical": random.uniform(0.3, 0.7),
-                    "fundamental": random.uniform(0.2, 0.8),
-                    "social": random.uniform(0.1, 0.9)
+                    "technical": 0.3 + 0.4 * u[5],
+                    "fundamental": 0.2 + 0.6 * u[6],
+                    "social": 0.1 + 0.8 * u[7]
                 }
             }
             
@@ -92,58 +230,112 @@ class AIInferenceService:
     
     async def predict_price_direction(self, df: pd.DataFrame, symbol: str) -> Dict[str, Any]:
         """가격 방향 예측"""
+        results = await self.predict_price_directions_batch([(df, symbol)])
+        return results[0]
+    
+    async def predict_price_directions_batch(self, items: List[Tuple[pd.DataFrame, str]]) -> List[Dict[str, Any]]:
+        """여러 심볼의 가격 방향을 한 번에 예측 (모델 호출은 배치당 1회)"""
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        rows = []
+        valid_index = []
+        
+        # 심볼별 특성 계산
+        for i, (df, symbol) in enumerate(items):
+            try:
+                if df.empty or len(df) < 10:
+                    raise ValueError("충분한 데이터가 없습니다")
+                
+                features = self._calculate_features(df)
+                
+                if features is None or len(features) < 3:
+                    raise ValueError("기술적 지표 계산 실패")
+                
+                rows.append(features)
+                valid_index.append(i)
+                
+            except Exception as e:
+                logger.error(f"가격 예측 오류: {e}")
+                results[i] = self._prediction_error(e)
+        
+        # 특성 행렬을 쌓아 단일 예측 호출
+        model_changes = self._predict_changes(np.vstack(rows)) if rows else None
+        
+        for k, i in enumerate(valid_index):
+            df, symbol = items[i]
+            try:
+                model_change = None if model_changes is None else float(model_changes[k])
+                results[i] = self._build_prediction(df, symbol, model_change)
+            except Exception as e:
+                logger.error(f"가격 예측 오류: {e}")
+                results[i] = self._prediction_error(e)
+        
+        return results
+    
+    def _predict_changes(self, X: np.ndarray) -> Optional[np.ndarray]:
+        """가격 예측 모델로 예상 변동률 계산 (모델 미학습 시 None)"""
+        name = 'price_prediction'
+        if not hasattr(self.models.get(name), 'estimators_'):
+            return None
+        
         try:
-            if df.empty or len(df) < 10:
-                raise ValueError("충분한 데이터가 없습니다")
-            
-            # 기술적 지표 계산
-            features = self._calculate_features(df)
-            
-            if features is None or len(features) < 5:
-                raise ValueError("기술적 지표 계산 실패")
-            
+            return self.models[name].predict(self._scale_features(X))
+        except Exception as e:
+            logger.error(f"모델 예측 오류: {e}")
+            return None
+    
+    def _build_prediction(self, df: pd.DataFrame, symbol: str, model_change: Optional[float]) -> Dict[str, Any]:
+        """단일 심볼 예측 결과 구성"""
+        u = self._rng.random(3).tolist()
+        
+        if model_change is not None:
+            # 학습된 모델의 예상 변동률로 방향 결정
+            predicted_direction = _direction_from_change(model_change)
+            expected_change = model_change
+        else:
             # 예측 (시뮬레이션)
-            directions = ["강한_상승", "상승", "중립", "하락", "강한_하락"]
-            probabilities = [0.15, 0.25, 0.3, 0.25, 0.05]
-            
-            predicted_direction = np.random.choice(directions, p=probabilities)
-            confidence = random.uniform(0.6, 0.9)
-            
-            # 예상 변동률
+            predicted_direction = _DIRECTION_LABELS[bisect_right(_DIRECTION_CUM_PROBABILITIES, u[0])]
             expected_change = self._calculate_expected_change(predicted_direction)
-            
-            # 시간대별 예측
-            hourly_predictions = []
-            for i in range(24):
-                hourly_predictions.append({
-                    "hour": i + 1,
-                    "direction": np.random.choice(["상승", "중립", "하락"], p=[0.4, 0.3, 0.3]),
-                    "change_percent": random.uniform(-5, 5)
-                })
-            
-            return {
-                "symbol": symbol,
-                "prediction": predicted_direction,
-                "confidence": confidence,
-                "expected_change_percent": expected_change,
-                "time_horizon": "24시간",
-                "technical_score": random.uniform(0.3, 0.8),
-                "hourly_predictions": hourly_predictions[:6],  # 첫 6시간만
-                "key_levels": {
-                    "support": float(df['low'].min() * 0.98),
-                    "resistance": float(df['high'].max() * 1.02)
-                },
-                "prediction_time": datetime.now().isoformat()
-            }
-            
-        except Exception as e:
-            logger.error(f"가격 예측 오류: {e}")
-            return {
-                "prediction": "중립",
-                "confidence": 0.5,
-                "expected_change_percent": 0.0,
-                "error": str(e)
+        
+        confidence = 0.6 + 0.3 * u[1]
+        
+        # 시간대별 예측 (응답에 포함되는 첫 6시간만 생성)
+        hours = 6
+        hourly_index = np.searchsorted(_HOURLY_CUM_PROBABILITIES, self._rng.random(hours), side='right')
+        hourly_changes = self._rng.uniform(-5, 5, hours)
+        
+        hourly_predictions = [
+            {
+                "hour": i + 1,
+                "direction": _HOURLY_LABELS[hourly_index[i]],
+                "change_percent": float(hourly_changes[i])
             }
+            for i in range(hours)
+        ]
+        
+        return {
+            "symbol": symbol,
+            "prediction": predicted_direction,
+            "confidence": confidence,
+            "expected_change_percent": expected_change,
+            "time_horizon": "24시간",
+            "technical_score": 0.3 + 0.5 * u[2],
+            "hourly_predictions": hourly_predictions,
+            "key_levels": {
+                # 응답 경계에서 float로 변환 (jsonable_encoder를 거치는 라우트도 있음)
+                "support": float(df['low'].min()) * 0.98,
+                "resistance": float(df['high'].max()) * 1.02
+            },
+            "prediction_time": _iso_now()
+        }
+    
+    def _prediction_error(self, error: Exception) -> Dict[str, Any]:
+        """예측 실패 시 기본 응답"""
+        return {
+            "prediction": "중립",
+            "confidence": 0.5,
+            "expected_change_percent": 0.0,
+            "error": str(error)
+        }
     
     async def generate_trading_strategy(self, symbol: str, market_data: Dict, 
                                        sentiment: Dict, prediction: Dict) -> Dict[str, Any]:
@@ -156,27 +348,10 @@ class AIInferenceService:
             # 종합 점수 계산
             combined_score = (sentiment_score * 0.4) + (prediction_score * 0.6)
             
-            # 전략 결정
-            if combined_score > 0.6:
-                action = "매수"
-                strategy_type = "적극매수"
-                position_size = 0.7
-            elif combined_score > 0.3:
-                action = "매수"
-                strategy_type = "부분매수"
-                position_size = 0.4
-            elif combined_score < -0.6:
-                action = "매도"
-                strategy_type = "적극매도"
-                position_size = 0.8
-            elif combined_score < -0.3:
-                action = "매도"
-                strategy_type = "부분매도"
-                position_size = 0.3
-            else:
-                action = "대기"
-                strategy_type = "관망"
-                position_size = 0.0
+            # 전략 결정 (경계값은 관망/부분 쪽에 포함)
+            idx = (bisect_right(_STRATEGY_SELL_THRESHOLDS, combined_score)
+                   + bisect_left(_STRATEGY_BUY_THRESHOLDS, combined_score))
+            action, strategy_type, position_size = _STRATEGY_TABLE[idx]
             
             # 리스크 관리
             stop_loss = self._calculate_stop_loss(action, market_data)
@@ -196,7 +371,7 @@ class AIInferenceService:
                 "risk_level": self._assess_risk_level(combined_score, market_data),
                 "expected_return": self._calculate_expected_return(action, prediction),
                 "reasoning": self._generate_strategy_reasoning(sentiment, prediction, combined_score),
-                "created_at": datetime.now().isoformat()
+                "created_at": _iso_now()
             }
             
         except Exception as e:
@@ -208,58 +383,45 @@ class AIInferenceService:
                 "error": str(e)
             }
     
-    async def calculate_technical_indicators(self, ohlcv_data: List[Dict]) -> Dict[str, Any]:
-        """기술적 지표 계산"""
-        try:
-            df = pd.DataFrame(ohlcv_data)
-            if df.empty:
-                return {}
-            
-            # 가격 컬럼 확인 및 변환
-            for col in ['open', 'high', 'low', 'close', 'volume']:
-                if col in df.columns:
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
-            
-            indicators = {}
-            
-            # 이동평균
-            if len(df) >= 20:
-                indicators['sma_20'] = float(ta.trend.sma_indicator(df['close'], window=20).iloc[-1])
-                indicators['ema_20'] = float(ta.trend.ema_indicator(df['close'], window=20).iloc[-1])
-            
-            # RSI
-            if len(df) >= 14:
-                indicators['rsi'] = float(ta.momentum.rsi(df['close'], window=14).iloc[-1])
-            
-            # MACD
-            if len(df) >= 26:
-                macd_line = ta.trend.macd(df['close'])
-                macd_signal = ta.trend.macd_signal(df['close'])
-                indicators['macd'] = float(macd_line.iloc[-1]) if not pd.isna(macd_line.iloc[-1]) else 0
-                indicators['macd_signal'] = float(macd_signal.iloc[-1]) if not pd.isna(macd_signal.iloc[-1]) else 0
-            
-            # 볼린저 밴드
-            if len(df) >= 20:
-                bb_high = ta.volatility.bollinger_hband(df['close'])
-                bb_low = ta.volatility.bollinger_lband(df['close'])
-                bb_mid = ta.volatility.bollinger_mavg(df['close'])
-                
-                indicators['bollinger'] = {
-                    'upper': float(bb_high.iloc[-1]) if not pd.isna(bb_high.iloc[-1]) else 0,
-                    'middle': float(bb_mid.iloc[-1]) if not pd.isna(bb_mid.iloc[-1]) else 0,
-                    'lower': float(bb_low.iloc[-1]) if not pd.isna(bb_low.iloc[-1]) else 0
-                }
-            
-            # 거래량 지표
-            if 'volume' in df.columns and len(df) >= 10:
-                indicators['volume_sma'] = float(df['volume'].rolling(10).mean().iloc[-1])
-                indicators['volume_ratio'] = float(df['volume'].iloc[-1] / indicators['volume_sma'])
-            
-            return indicators
-            
-        except Exception as e:
-            logger.error(f"기술적 지표 계산 오류: {e}")
-            return {}
+    async def calculate_stop_take_profits(self, actions: List[str], prices: np.ndarray,
+                                          vols: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """여러 전략의 손절매/익절매 가격을 한 번에 계산"""
+        signs = np.fromiter((_SIGN.get(a, 0.0) for a in actions), dtype=np.float64, count=len(actions))
+        scaled = signs * np.asarray(vols, dtype=np.float64)
+        prices = np.asarray(prices, dtype=np.float64)
+        stops = prices * (1 - scaled * 2)
+        takes = prices * (1 + scaled * 3)
+        return stops, takes
+    
+    async def calculate_technical_indicators(self, ohlcv_data) -> Dict[str, Any]:
+        """기술적 지표 계산 (캔들 목록 또는 컬럼별 배열)"""
+        return technical_indicators(ohlcv_data)
+    
+    async def calculate_technical_indicators_batch(self, symbol_to_ohlcv: Dict[str, List[Dict]]) -> Dict[str, Dict[str, Any]]:
+        """여러 심볼의 기술적 지표를 프로세스 풀에서 병렬 계산"""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        
+        loop = asyncio.get_running_loop()
+        tasks = {}
+        results = {}
+        for symbol, data in symbol_to_ohlcv.items():
+            try:
+                # 캔들 목록은 부모에서 배열로 변환해 워커에는 배열만 전달
+                close, volume = ohlcv_to_arrays(data)
+            except Exception as e:
+                logger.error(f"기술적 지표 계산 오류 ({symbol}): {e}")
+                results[symbol] = {}
+                continue
+            tasks[symbol] = loop.run_in_executor(self._pool, indicators_worker, close, volume)
+        
+        for symbol, task in tasks.items():
+            try:
+                results[symbol] = await task
+            except Exception as e:
+                logger.error(f"기술적 지표 계산 오류 ({symbol}): {e}")
+                results[symbol] = {}
+        return results
     
     async def assess_trading_risk(self, symbol: str, investment_amount: float) -> Dict[str, Any]:
         """거래 리스크 평가"""
@@ -281,18 +443,14 @@ class AIInferenceService:
             total_risk_score = min(base_risk * amount_risk_multiplier, 1.0)
             
             # 리스크 등급
-            if total_risk_score < 0.3:
-                risk_level = "낮음"
-            elif total_risk_score < 0.6:
-                risk_level = "보통"
-            elif total_risk_score < 0.8:
-                risk_level = "높음"
-            else:
-                risk_level = "매우높음"
+            risk_level = _RISK_LEVELS[bisect_right(_RISK_THRESHOLDS, total_risk_score)]
             
             # 추천 포지션 크기
             recommended_position = max(0.1, 1.0 - total_risk_score)
             
+            # 리스크 요인 난수를 한 번에 생성
+            u = self._rng.random(3).tolist()
+            
             return {
                 "symbol": symbol,
                 "investment_amount": investment_amount,
@@ -301,12 +459,12 @@ class AIInferenceService:
                 "recommended_position_size": recommended_position,
                 "max_loss_estimate": investment_amount * total_risk_score * 0.5,
                 "risk_factors": {
-                    "market_volatility": random.uniform(0.3, 0.9),
-                    "liquidity_risk": random.uniform(0.1, 0.7),
-                    "correlation_risk": random.uniform(0.2, 0.8)
+                    "market_volatility": 0.3 + 0.6 * u[0],
+                    "liquidity_risk": 0.1 + 0.6 * u[1],
+                    "correlation_risk": 0.2 + 0.6 * u[2]
                 },
                 "recommendations": self._generate_risk_recommendations(risk_level),
-                "assessment_time": datetime.now().isoformat()
+                "assessment_time": _iso_now()
             }
             
         except Exception as e:
@@ -324,19 +482,10 @@ class AIInferenceService:
             if len(df) < 20:
                 return None
             
-            features = []
-            
-            # 가격 관련 특성
-            price_change = (df['close'].iloc[-1] - df['close'].iloc[-5]) / df['close'].iloc[-5]
-            features.append(price_change)
-            
-            # 거래량 특성
-            volume_ratio = df['volume'].iloc[-1] / df['volume'].mean()
-            features.append(volume_ratio)
-            
-            # 변동성
-            volatility = df['close'].pct_change().std()
-            features.append(volatility)
+            features = _features_kernel(
+                df['close'].to_numpy(dtype=np.float64),
+                df['volume'].to_numpy(dtype=np.float64)
+            )
             
             return np.array(features)
             
@@ -346,58 +495,30 @@ class AIInferenceService:
     
     def _convert_sentiment_to_score(self, sentiment: str) -> float:
         """심리를 점수로 변환"""
-        sentiment_map = {
-            "매우_낙관적": 0.9,
-            "낙관적": 0.6,
-            "중립": 0.0,
-            "비관적": -0.6,
-            "매우_비관적": -0.9
-        }
-        return sentiment_map.get(sentiment, 0.0)
+        return _SENTIMENT_SCORE.get(sentiment, 0.0)
     
     def _convert_prediction_to_score(self, prediction: str) -> float:
         """예측을 점수로 변환"""
-        prediction_map = {
-            "강한_상승": 0.9,
-            "상승": 0.6,
-            "중립": 0.0,
-            "하락": -0.6,
-            "강한_하락": -0.9
-        }
-        return prediction_map.get(prediction, 0.0)
+        return _PREDICTION_SCORE.get(prediction, 0.0)
     
     def _calculate_expected_change(self, direction: str) -> float:
         """예상 변동률 계산"""
-        change_map = {
-            "강한_상승": random.uniform(5, 15),
-            "상승": random.uniform(1, 5),
-            "중립": random.uniform(-1, 1),
-            "하락": random.uniform(-5, -1),
-            "강한_하락": random.uniform(-15, -5)
-        }
-        return change_map.get(direction, 0.0)
+        change_range = _EXPECTED_CHANGE_RANGE.get(direction)
+        if change_range is None:
+            return 0.0
+        return float(self._rng.uniform(*change_range))
     
     def _calculate_stop_loss(self, action: str, market_data: Dict) -> float:
         """손절매 계산"""
         current_price = market_data.get('current_price', 0)
         volatility = market_data.get('volatility', 0.02)
-        
-        if action == "매수":
-            return current_price * (1 - volatility * 2)
-        elif action == "매도":
-            return current_price * (1 + volatility * 2)
-        return current_price
+        return current_price * (1 - _SIGN.get(action, 0.0) * volatility * 2)
     
     def _calculate_take_profit(self, action: str, market_data: Dict) -> float:
         """익절매 계산"""
         current_price = market_data.get('current_price', 0)
         volatility = market_data.get('volatility', 0.02)
-        
-        if action == "매수":
-            return current_price * (1 + volatility * 3)
-        elif action == "매도":
-            return current_price * (1 - volatility * 3)
-        return current_price
+        return current_price * (1 + _SIGN.get(action, 0.0) * volatility * 3)
     
     def _generate_entry_conditions(self, action: str, market_data: Dict) -> List[str]:
         """진입 조건 생성"""
@@ -0,0 +1,349 @@
+"""
+📐 기술적 지표 계산
+서비스 인스턴스 없이 배열만으로 동작하는 순수 함수 모음
+(프로세스 풀 워커가 AI 서비스 전체를 임포트/초기화하지 않도록 분리)
+"""
+
+from typing import Dict, Optional, Any, Tuple
+import pandas as pd
+import numpy as np
+import ta
+
+# TA-Lib C 커널 (선택 의존성 - 미설치 시 ta 라이브러리 사용)
+try:
+    import talib
+except ImportError:
+    try:
+        import pytafast as talib
+    except ImportError:
+        talib = None
+
+from src.core.logging_config import get_logger
+from src.core.jit import njit, NUMBA_AVAILABLE
+
+logger = get_logger(__name__)
+
+# RSI 커널 (ta.momentum.rsi와 동일한 Wilder EMA: alpha=1/period, adjust=False)
+@njit(cache=True, fastmath=True)
+def _wilder_rsi_14(close: np.ndarray) -> np.ndarray:
+    """기간 14 전용 RSI 커널"""
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+    alpha = 1.0 / 14
+    ema_up = 0.0
+    ema_down = 0.0
+    
+    # 초기 구간 (기간 상수로 고정된 반복 횟수)
+    warmup = 14 if n >= 14 else n
+    for i in range(1, warmup):
+        diff = close[i] - close[i - 1]
+        ema_up = (1.0 - alpha) * ema_up + alpha * (diff if diff > 0 else 0.0)
+        ema_down = (1.0 - alpha) * ema_down + alpha * (-diff if diff < 0 else 0.0)
+    
+    if n >= 14:
+        out[13] = 100.0 if ema_down == 0 else 100.0 - 100.0 / (1.0 + ema_up / ema_down)
+    
+    for i in range(14, n):
+        diff = close[i] - close[i - 1]
+        ema_up = (1.0 - alpha) * ema_up + alpha * (diff if diff > 0 else 0.0)
+        ema_down = (1.0 - alpha) * ema_down + alpha * (-diff if diff < 0 else 0.0)
+        out[i] = 100.0 if ema_down == 0 else 100.0 - 100.0 / (1.0 + ema_up / ema_down)
+    
+    return out
+
+@njit(cache=True, fastmath=True)
+def _wilder_rsi(close: np.ndarray, period: int) -> np.ndarray:
+    """임의 기간 RSI 커널"""
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+    alpha = 1.0 / period
+    ema_up = 0.0
+    ema_down = 0.0
+    
+    for i in range(1, n):
+        diff = close[i] - close[i - 1]
+        ema_up = (1.0 - alpha) * ema_up + alpha * (diff if diff > 0 else 0.0)
+        ema_down = (1.0 - alpha) * ema_down + alpha * (-diff if diff < 0 else 0.0)
+        if i >= period - 1:
+            out[i] = 100.0 if ema_down == 0 else 100.0 - 100.0 / (1.0 + ema_up / ema_down)
+    
+    return out
+
+# 기간별 특화 커널 (numba는 첫 호출 시 컴파일)
+_RSI_KERNELS = {14: _wilder_rsi_14}
+
+def _last_or_zero(values: np.ndarray) -> float:
+    """지표 배열의 마지막 값 (NaN이면 0)"""
+    last = values[-1]
+    return 0.0 if np.isnan(last) else float(last)
+
+def _calculate_rsi(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """RSI 계산 - 특화 커널이 없으면 범용 커널 사용 (JIT 컴파일된 경우에만 호출)"""
+    kernel = _RSI_KERNELS.get(period)
+    if kernel is not None:
+        return kernel(close)
+    return _wilder_rsi(close, period)
+
+@njit(cache=True, fastmath=True)
+def _compute_all_indicators(close: np.ndarray, volume: np.ndarray):
+    """SMA20, EMA20, RSI14, MACD(12,26,9), 볼린저(20,2), 거래량 SMA10을 단일 루프로 계산
+    
+    ta 라이브러리와 같은 정의(EMA adjust=False, 볼린저 모표준편차)를 따르며
+    마지막 값만 반환한다. 데이터가 부족한 지표는 NaN.
+    """
+    n = close.shape[0]
+    nan = np.nan
+    
+    alpha_20 = 2.0 / 21.0
+    alpha_12 = 2.0 / 13.0
+    alpha_26 = 2.0 / 27.0
+    alpha_9 = 2.0 / 10.0
+    alpha_rsi = 1.0 / 14.0
+    
+    # 이동 구간 합계 (큰 가격대의 상쇄 오차를 줄이기 위해 첫 값 기준으로 이동)
+    shift = close[0] if n > 0 else 0.0
+    window_sum = 0.0
+    window_sq = 0.0
+    volume_sum = 0.0
+    
+    ema_20 = close[0] if n > 0 else 0.0
+    ema_12 = ema_20
+    ema_26 = ema_20
+    signal = 0.0
+    ema_up = 0.0
+    ema_down = 0.0
+    
+    for i in range(n):
+        price = close[i]
+        
+        # SMA20 / 볼린저용 구간 합계
+        d = price - shift
+        window_sum += d
+        window_sq += d * d
+        if i >= 20:
+            old = close[i - 20] - shift
+            window_sum -= old
+            window_sq -= old * old
+        
+        # 거래량 SMA10
+        volume_sum += volume[i]
+        if i >= 10:
+            volume_sum -= volume[i - 10]
+        
+        if i > 0:
+            # EMA (첫 값에서 시작하는 재귀식)
+            ema_20 = alpha_20 * price + (1.0 - alpha_20) * ema_20
+            ema_12 = alpha_12 * price + (1.0 - alpha_12) * ema_12
+            ema_26 = alpha_26 * price + (1.0 - alpha_26) * ema_26
+            
+            # RSI (Wilder EMA)
+            diff = price - close[i - 1]
+            ema_up = (1.0 - alpha_rsi) * ema_up + alpha_rsi * (diff if diff > 0 else 0.0)
+            ema_down = (1.0 - alpha_rsi) * ema_down + alpha_rsi * (-diff if diff < 0 else 0.0)
+        
+        # MACD 시그널은 MACD 라인이 유효해지는 26번째 값부터 시작
+        if i == 25:
+            signal = ema_12 - ema_26
+        elif i > 25:
+            signal = alpha_9 * (ema_12 - ema_26) + (1.0 - alpha_9) * signal
+    
+    sma_20 = nan
+    ema_20_out = nan
+    bb_upper = nan
+    bb_lower = nan
+    if n >= 20:
+        mean_d = window_sum / 20.0
+        variance = window_sq / 20.0 - mean_d * mean_d
+        std = np.sqrt(variance) if variance > 0 else 0.0
+        sma_20 = shift + mean_d
+        ema_20_out = ema_20
+        bb_upper = sma_20 + 2.0 * std
+        bb_lower = sma_20 - 2.0 * std
+    
+    rsi = nan
+    if n >= 14:
+        rsi = 100.0 if ema_down == 0 else 100.0 - 100.0 / (1.0 + ema_up / ema_down)
+    
+    macd = nan
+    macd_signal = nan
+    if n >= 26:
+        macd = ema_12 - ema_26
+    if n >= 34:
+        macd_signal = signal
+    
+    volume_sma = volume_sum / 10.0 if n >= 10 else nan
+    
+    return sma_20, ema_20_out, rsi, macd, macd_signal, bb_upper, bb_lower, volume_sma
+
+def ohlcv_to_arrays(ohlcv_data) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """캔들 목록 또는 컬럼별 배열을 종가/거래량 numpy 배열로 변환"""
+    if isinstance(ohlcv_data, dict):
+        # 컬럼별 배열 입력은 변환 없이 사용
+        close = np.asarray(ohlcv_data['close'], dtype=np.float64)
+        volume = np.asarray(ohlcv_data['volume'], dtype=np.float64) if 'volume' in ohlcv_data else None
+        return close, volume
+
+    n = len(ohlcv_data)
+    if n == 0:
+        return np.empty(0), None
+
+    # 필요한 컬럼만 numpy 배열로 직접 변환 (DataFrame 생략)
+    close = np.fromiter(
+        (float(d.get('close', 0.0) or 0.0) for d in ohlcv_data), dtype=np.float64, count=n
+    )
+    has_volume = 'volume' in ohlcv_data[0]
+    volume = np.fromiter(
+        (float(d.get('volume', 0.0) or 0.0) for d in ohlcv_data), dtype=np.float64, count=n
+    ) if has_volume else None
+    return close, volume
+
+def technical_indicators(ohlcv_data) -> Dict[str, Any]:
+    """기술적 지표 계산 (캔들 목록 또는 컬럼별 배열)"""
+    try:
+        return indicators_from_arrays(*ohlcv_to_arrays(ohlcv_data))
+    except Exception as e:
+        logger.error(f"기술적 지표 계산 오류: {e}")
+        return {}
+
+def indicators_from_arrays(close: np.ndarray, volume: Optional[np.ndarray]) -> Dict[str, Any]:
+    """종가/거래량 배열로 지표 계산
+    
+    구현 선택 순서:
+    1. TA-Lib (또는 pytafast) - 설치되어 있으면 항상 사용
+    2. numba 단일 패스 커널 - TA-Lib이 없고 거래량이 있을 때
+    3. ta 라이브러리 - 그 외
+    """
+    n = close.shape[0]
+    if n == 0:
+        return {}
+
+    if talib is not None:
+        indicators = _talib_indicators(close)
+    elif NUMBA_AVAILABLE and volume is not None:
+        # 가격/거래량 지표를 한 번의 배열 순회로 계산
+        return _fused_indicators(close, volume)
+    else:
+        indicators = _ta_indicators(pd.Series(close))
+
+    # 거래량 지표
+    if volume is not None and n >= 10:
+        indicators['volume_sma'] = float(volume[-10:].mean())
+        indicators['volume_ratio'] = float(volume[-1] / indicators['volume_sma'])
+
+    return indicators
+
+def _fused_indicators(close: np.ndarray, volume: np.ndarray) -> Dict[str, Any]:
+    """단일 패스 커널 기반 지표 계산"""
+    indicators = {}
+    n = close.shape[0]
+    (sma_20, ema_20, rsi, macd, macd_signal,
+     bb_upper, bb_lower, volume_sma) = _compute_all_indicators(close, volume)
+
+    # 이동평균
+    if n >= 20:
+        indicators['sma_20'] = float(sma_20)
+        indicators['ema_20'] = float(ema_20)
+
+    # RSI
+    if n >= 14:
+        indicators['rsi'] = float(rsi)
+
+    # MACD (시그널은 데이터 부족 시 0)
+    if n >= 26:
+        indicators['macd'] = float(macd)
+        indicators['macd_signal'] = 0.0 if np.isnan(macd_signal) else float(macd_signal)
+
+    # 볼린저 밴드
+    if n >= 20:
+        indicators['bollinger'] = {
+            'upper': float(bb_upper),
+            'middle': float(sma_20),
+            'lower': float(bb_lower)
+        }
+
+    # 거래량 지표
+    if n >= 10:
+        indicators['volume_sma'] = float(volume_sma)
+        indicators['volume_ratio'] = float(volume[-1] / volume_sma)
+
+    return indicators
+
+def _talib_indicators(close: np.ndarray) -> Dict[str, Any]:
+    """TA-Lib 기반 가격 지표 계산 (마지막 값만 사용)"""
+    indicators = {}
+    n = close.shape[0]
+
+    # 이동평균
+    if n >= 20:
+        indicators['sma_20'] = float(talib.SMA(close, timeperiod=20)[-1])
+        indicators['ema_20'] = float(talib.EMA(close, timeperiod=20)[-1])
+
+    # RSI
+    if n >= 14:
+        indicators['rsi'] = float(talib.RSI(close, timeperiod=14)[-1])
+
+    # MACD (라인/시그널/히스토그램을 한 번에 계산)
+    if n >= 26:
+        macd_line, macd_signal, _ = talib.MACD(close, fastperiod=12, slowperiod=26, signalperiod=9)
+        indicators['macd'] = _last_or_zero(macd_line)
+        indicators['macd_signal'] = _last_or_zero(macd_signal)
+
+    # 볼린저 밴드 (상단/중간/하단을 한 번에 계산)
+    if n >= 20:
+        bb_high, bb_mid, bb_low = talib.BBANDS(close, timeperiod=20, nbdevup=2, nbdevdn=2)
+        indicators['bollinger'] = {
+            'upper': _last_or_zero(bb_high),
+            'middle': _last_or_zero(bb_mid),
+            'lower': _last_or_zero(bb_low)
+        }
+
+    return indicators
+
+def _ta_indicators(close: pd.Series) -> Dict[str, Any]:
+    """ta 라이브러리 기반 가격 지표 계산"""
+    indicators = {}
+
+    # 이동평균
+    if len(close) >= 20:
+        indicators['sma_20'] = float(ta.trend.sma_indicator(close, window=20).iloc[-1])
+        indicators['ema_20'] = float(ta.trend.ema_indicator(close, window=20).iloc[-1])
+
+    # RSI (numba 미설치 시 커널이 순수 파이썬 루프가 되므로 ta 구현 사용)
+    if len(close) >= 14:
+        if NUMBA_AVAILABLE:
+            indicators['rsi'] = float(_calculate_rsi(close.to_numpy(dtype=np.float64), 14)[-1])
+        else:
+            indicators['rsi'] = float(ta.momentum.rsi(close, window=14).iloc[-1])
+
+    # MACD
+    if len(close) >= 26:
+        macd_line = ta.trend.macd(close)
+        macd_signal = ta.trend.macd_signal(close)
+        indicators['macd'] = float(macd_line.iloc[-1]) if not pd.isna(macd_line.iloc[-1]) else 0
+        indicators['macd_signal'] = float(macd_signal.iloc[-1]) if not pd.isna(macd_signal.iloc[-1]) else 0
+
+    # 볼린저 밴드
+    if len(close) >= 20:
+        bb_high = ta.volatility.bollinger_hband(close)
+        bb_low = ta.volatility.bollinger_lband(close)
+        bb_mid = ta.volatility.bollinger_mavg(close)
+
+        indicators['bollinger'] = {
+            'upper': float(bb_high.iloc[-1]) if not pd.isna(bb_high.iloc[-1]) else 0,
+            'middle': float(bb_mid.iloc[-1]) if not pd.isna(bb_mid.iloc[-1]) else 0,
+            'lower': float(bb_low.iloc[-1]) if not pd.isna(bb_low.iloc[-1]) else 0
+        }
+
+    return indicators
+
+def indicators_worker(close: np.ndarray, volume: Optional[np.ndarray]) -> Dict[str, Any]:
+    """프로세스 풀 워커 - 심볼 하나의 종가/거래량 배열로 지표 계산
+    
+    서비스 인스턴스에 의존하지 않으므로 spawn/forkserver 워커도
+    이 모듈만 임포트한다.
+    """
+    return indicators_from_arrays(close, volume)
+
+# 첫 요청에서 JIT 컴파일 비용이 발생하지 않도록 임포트 시 미리 컴파일
+if NUMBA_AVAILABLE:
+    _compute_all_indicators(np.ones(40), np.ones(40))
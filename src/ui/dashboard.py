@@ -6,12 +6,15 @@ Streamlit 기반 웹 인터페이스
 
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
+import asyncio
+import httpx
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
+from collections import deque
+from itertools import islice
 from datetime import datetime, timedelta
-import time
 import numpy as np
 
 # 페이지 설정
@@ -28,7 +31,9 @@ if 'initialized' not in st.session_state:
     st.session_state.api_retries = 0
 
 # 스타일 설정
-st.markdown("""
+# 매 실행마다 다시 출력해야 함 - Streamlit은 이번 실행에서 출력되지 않은 요소를 화면에서 제거하므로
+# session_state로 한 번만 출력하면 첫 새로고침 이후 스타일이 사라짐
+CUSTOM_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -52,35 +57,141 @@ st.markdown("""
     .status-completed { color: #007bff; }
     .status-stopped { color: #dc3545; }
 </style>
-""", unsafe_allow_html=True)
+"""
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+@st.cache_resource
+def _session():
+    """API 호출용 HTTP 세션 (keep-alive 연결 재사용)"""
+    # 모듈 변수로 두면 재실행마다 스크립트가 다시 실행되어 새 세션(새 연결)이 만들어짐
+    session = requests.Session()
+    # 브라우저 세션(스크립트 스레드)들이 한 세션을 공유하므로 호스트당 연결 풀을 넉넉히 유지
+    # 연결 실패는 짧은 백오프로 재시도
+    session.mount("http://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=50,
+        max_retries=Retry(total=3, backoff_factor=0.1)
+    ))
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
+# 표시용 라벨 (선택지 포맷·상태 갱신 때마다 딕셔너리를 새로 만들지 않도록 모듈 상수로 유지)
+_STRAT_LABELS = {
+    "arbitrage": "🔄 차익거래",
+    "short_trading": "⚡ 단타매매",
+    "leverage_trading": "📈 레버리지",
+    "meme_trading": "🐕 밈코인"
+}
+
+_STATUS_ICON = {
+    "running": "🟢",
+    "completed": "🔵",
+    "stopped": "🔴"
+}
+
+_HEALTH_ICON = {
+    "healthy": "✅",
+    "not_configured": "⚠️"
+}
+
+# 차트 공통 설정 - 잔고 선 그래프에 쓰지 않는 모드바 버튼(올가미/박스 선택 등)은 숨김
+_CHART_CONFIG = {'displayModeBar': False, 'doubleClick': 'reset', 'responsive': True}
+
+# 잔고 차트 공통 레이아웃 (x축 눈금 형식을 고정해 Plotly가 매번 추정하지 않도록 함)
+_BASE_LAYOUT = {
+    'template': "plotly_white",
+    'height': 400,
+    'margin': dict(l=40, r=20, t=40, b=40),
+    'hovermode': 'x unified',
+    'xaxis': dict(title="시간", tickformat="%H:%M"),
+    'yaxis': dict(title="잔고 (원)")
+}
+
+def post_json(url, payload, timeout):
+    """JSON POST 요청 (요청 본문도 orjson으로 직렬화)"""
+    return _session().post(
+        url,
+        data=orjson.dumps(payload),
+        headers={"Content-Type": "application/json"},
+        timeout=timeout
+    )
+
+@st.cache_resource
+def _client(base_url):
+    """상태 폴링용 httpx 클라이언트 (API 주소별로 하나를 재사용)"""
+    return httpx.Client(base_url=base_url, timeout=httpx.Timeout(5.0, connect=1.0))
+
+# 데모/모의 데이터용 난수 생성기 (호출마다 Generator를 새로 만들지 않음)
+_RNG = np.random.default_rng()
 
-# API 베이스 URL - 실제 서버 주소 사용
-API_BASE_URL = "http://127.0.0.1:8000/api/v1"
+# 대시보드에 보관할 최근 거래 기록 수
+MAX_TRADE_HISTORY = 5000
+
+# 상태 화면에 표시할 최근 거래 수
+RECENT_TRADE_ROWS = 20
+
+# 차트에 보낼 최대 구간 수 (차트 폭 ~1000px 기준)
+CHART_MAX_BINS = 1000
+
+# 연결 확인에 사용할 헬스체크 주소
+HEALTH_URLS = (
+    "http://127.0.0.1:8000/health",
+    "http://localhost:8000/health",
+    "http://0.0.0.0:8000/health"
+)
+
+async def _probe(client, url):
+    """헬스체크 주소 하나의 응답 코드 조회"""
+    response = await client.get(url)
+    return url, response.status_code
+
+async def _probe_first(urls):
+    """헬스체크 주소를 동시에 조회해 가장 먼저 200을 응답한 주소 반환 (나머지 요청은 취소)"""
+    async with httpx.AsyncClient(timeout=httpx.Timeout(5.0, connect=1.0)) as client:
+        pending = {asyncio.create_task(_probe(client, url)) for url in urls}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        continue
+                    url, status_code = task.result()
+                    if status_code == 200:
+                        return url
+        finally:
+            # 느린 주소를 기다리지 않도록 남은 요청 취소 후 정리
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+    return None
+
+@st.cache_data(ttl=300, show_spinner=False)
+def probe_api_base_url():
+    """응답하는 API 서버 주소 탐색 (성공 결과만 5분 캐시)"""
+    url = asyncio.run(_probe_first(HEALTH_URLS))
+    if url is not None:
+        return url.replace("/health", "/api/v1")
+    
+    # 예외는 캐시되지 않으므로 서버가 다시 뜨면 다음 실행에서 바로 재탐색
+    raise ConnectionError("API 서버에 연결할 수 없습니다")
 
 def check_api_connection():
-    """API 서버 연결 확인"""
+    """API 서버 연결 확인 (확인된 주소는 세션에 보관해 재실행 시 탐색 생략)"""
+    if 'api_base_url' in st.session_state:
+        return True
+    
     try:
-        # 여러 방법으로 연결 시도
-        urls_to_try = [
-            "http://127.0.0.1:8000/health",
-            "http://localhost:8000/health",
-            "http://0.0.0.0:8000/health"
-        ]
-        
-        for url in urls_to_try:
-            try:
-                response = requests.get(url, timeout=5)
-                if response.status_code == 200:
-                    global API_BASE_URL
-                    API_BASE_URL = url.replace("/health", "/api/v1")
-                    st.session_state.api_url = API_BASE_URL
-                    return True
-            except Exception as e:
-                continue
-        return False
+        st.session_state.api_base_url = probe_api_base_url()
+        return True
     except Exception as e:
         return False
 
+def reconnect_api():
+    """저장된 API 주소를 버리고 다시 탐색"""
+    st.session_state.pop('api_base_url', None)
+    probe_api_base_url.clear()
+    st.rerun()
+
 def main():
     """메인 대시보드"""
     
@@ -100,13 +211,8 @@ def main():
         
         strategy = st.selectbox(
             "거래 전략",
-            ["arbitrage", "short_trading", "leverage_trading", "meme_trading"],
-            format_func=lambda x: {
-                "arbitrage": "🔄 차익거래",
-                "short_trading": "⚡ 단타매매",
-                "leverage_trading": "📈 레버리지",
-                "meme_trading": "🐕 밈코인"
-            }[x]
+            list(_STRAT_LABELS),
+            format_func=_STRAT_LABELS.get
         )
         
         symbol = st.selectbox(
@@ -137,48 +243,46 @@ def main():
             st.code(f"ID: {st.session_state.simulation_id[:8]}...")
             if st.button("🛑 시뮬레이션 중지", type="secondary"):
                 stop_simulation()
+        
+        st.divider()
+        st.caption(f"🔗 API: {st.session_state.api_base_url}")
+        if st.button("🔄 API 재연결", use_container_width=True):
+            reconnect_api()
     
-    # 메인 컨텐츠
-    tab1, tab2, tab3, tab4 = st.tabs(["📊 실시간 모니터링", "📈 백테스팅", "📋 거래 기록", "⚙️ 시스템 상태"])
-    
-    with tab1:
-        try:
-            show_realtime_monitoring()
-        except Exception as e:
-            st.error(f"실시간 모니터링 오류: {str(e)}")
-    
-    with tab2:
-        try:
-            show_backtesting()
-        except Exception as e:
-            st.error(f"백테스팅 오류: {str(e)}")
+    # 메인 컨텐츠 - st.tabs는 보이지 않는 탭 본문(API 호출 포함)까지 매번 실행하므로
+    # 선택된 화면 하나만 그림
+    active_tab = st.radio(
+        "화면",
+        list(_TABS),
+        horizontal=True,
+        key="active_tab",
+        label_visibility="collapsed"
+    )
     
-    with tab3:
-        try:
-            show_trade_history()
-        except Exception as e:
-            st.error(f"거래 기록 오류: {str(e)}")
-    
-    with tab4:
-        try:
-            show_system_status()
-        except Exception as e:
-            st.error(f"시스템 상태 오류: {str(e)}")
+    render, error_label = _TABS[active_tab]
+    try:
+        render()
+    except Exception as e:
+        st.error(f"{error_label} 오류: {str(e)}")
 
 def start_simulation(strategy, symbol, initial_balance, duration_hours):
     """시뮬레이션 시작"""
     try:
         with st.spinner("시뮬레이션을 시작하는 중..."):
-            response = requests.post(f"{API_BASE_URL}/simulation/start", json={
+            response = post_json(f"{st.session_state.api_base_url}/simulation/start", {
                 "strategy": strategy,
                 "symbol": symbol,
                 "initial_balance": initial_balance,
                 "duration_hours": duration_hours
-            }, timeout=10)
+            }, timeout=(1, 10))
         
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             st.session_state.simulation_id = result["simulation_id"]
+            st.session_state.simulation_running = True
+            st.session_state.sim_trades = deque(maxlen=MAX_TRADE_HISTORY)
+            st.session_state.trade_cursor = 0
+            fetch_simulation_status.clear()
             st.success(f"✅ 시뮬레이션이 시작되었습니다! ID: {result['simulation_id'][:8]}...")
             st.rerun()
         else:
@@ -191,9 +295,10 @@ def start_simulation(strategy, symbol, initial_balance, duration_hours):
 def stop_simulation():
     """시뮬레이션 중지"""
     try:
-        response = requests.delete(f"{API_BASE_URL}/simulation/{st.session_state.simulation_id}")
+        response = _session().delete(f"{st.session_state.api_base_url}/simulation/{st.session_state.simulation_id}", timeout=(1, 5))
         if response.status_code == 200:
             st.success("✅ 시뮬레이션이 중지되었습니다.")
+            fetch_simulation_status.clear()
             del st.session_state.simulation_id
             st.rerun()
     except Exception as e:
@@ -204,6 +309,8 @@ def show_realtime_monitoring():
     st.subheader("📊 실시간 시뮬레이션 모니터링")
     
     if "simulation_id" not in st.session_state:
+        import plotly.graph_objects as go  # 차트를 그릴 때만 로드 (첫 실행 시작 시간 단축)
+        
         st.info("👈 사이드바에서 시뮬레이션을 시작해주세요.")
         
         # 데모 차트 표시
@@ -211,93 +318,131 @@ def show_realtime_monitoring():
         demo_data = generate_demo_data()
         
         fig = go.Figure()
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=demo_data['time'],
             y=demo_data['balance'],
             mode='lines+markers',
             name='잔고 변화',
-            line=dict(color='#4ECDC4', width=3),
+            line=dict(color='#4ECDC4', width=3, shape='linear'),
             marker=dict(size=6)
         ))
         
-        fig.update_layout(
-            title="💰 데모: 잔고 변화",
-            xaxis_title="시간",
-            yaxis_title="잔고 (원)",
-            template="plotly_white",
-            height=400
-        )
+        fig.update_layout(_BASE_LAYOUT, title="💰 데모: 잔고 변화")
         
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, config=_CHART_CONFIG)
+        return
+    
+    # 실행 중일 때만 5초마다 상태 영역만 다시 그림 (전체 스크립트 재실행 없음)
+    run_every = 5 if st.session_state.get('simulation_running', True) else None
+    st.fragment(render_simulation_status, run_every=run_every)()
+
+@st.cache_data(ttl=1, show_spinner=False)
+def fetch_simulation_status(api_base_url, simulation_id, since=0):
+    """시뮬레이션 상태 조회 (1초 캐시, since 이후의 거래 기록과 구간 집계 차트만 수신)"""
+    response = _client(api_base_url).get(
+        f"/simulation/status/{simulation_id}",
+        params={"since": since, "buckets": CHART_MAX_BINS}
+    )
+    if response.status_code == 200:
+        return orjson.loads(response.content)
+    return None
+
+def render_simulation_status():
+    """시뮬레이션 상태 메트릭 및 차트"""
+    if "simulation_id" not in st.session_state:
         return
     
-    # 시뮬레이션 상태 조회
     try:
-        response = requests.get(f"{API_BASE_URL}/simulation/status/{st.session_state.simulation_id}", timeout=5)
-        if response.status_code == 200:
-            status = response.json()
-            
-            # 메트릭 표시
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                profit_loss = status.get('profit_loss', 0)
-                st.metric(
-                    "현재 잔고",
-                    f"{status.get('current_balance', 0):,.0f}원",
-                    f"{profit_loss:+,.0f}원"
-                )
-            
-            with col2:
-                profit_rate = status.get('profit_rate', 0)
-                st.metric(
-                    "수익률",
-                    f"{profit_rate:+.2f}%",
-                    f"{profit_rate:+.2f}%"
-                )
+        status = fetch_simulation_status(
+            st.session_state.api_base_url, st.session_state.simulation_id, st.session_state.trade_cursor
+        )
+        if status is not None:
+            # 새 거래 기록만 누적 (같은 응답이 캐시에서 다시 와도 중복 없음)
+            new_trades = status['trades'][st.session_state.trade_cursor - status['trades_since']:]
+            st.session_state.sim_trades.extend(new_trades)
+            st.session_state.trade_cursor += len(new_trades)
             
-            with col3:
-                st.metric("거래 횟수", f"{status.get('trade_count', 0)}회")
+            # 상태 값은 한 번만 꺼내 사용
+            profit_loss = status.get('profit_loss', 0)
+            profit_rate = status.get('profit_rate', 0)
+            trade_count = status.get('trade_count', 0)
+            status_text = status.get('status', 'unknown')
             
-            with col4:
-                status_text = status.get('status', 'unknown')
-                status_color = {
-                    "running": "🟢",
-                    "completed": "🔵",
-                    "stopped": "🔴"
-                }.get(status_text, "⚪")
-                st.metric("상태", f"{status_color} {status_text}")
+            # 메트릭 표시 (라벨, 값, 변화량)
+            metrics = (
+                ("현재 잔고", f"{status.get('current_balance', 0):,.0f}원", f"{profit_loss:+,.0f}원"),
+                ("수익률", f"{profit_rate:+.2f}%", f"{profit_rate:+.2f}%"),
+                ("거래 횟수", f"{trade_count}회", None),
+                ("상태", f"{_STATUS_ICON.get(status_text, '⚪')} {status_text}", None)
+            )
+            for (label, value, delta), col in zip(metrics, st.columns(4)):
+                col.metric(label, value, delta)
             
-            # 실시간 차트
-            if status.get('trade_count', 0) > 0:
-                chart_data = generate_mock_chart_data(status['trade_count'], status['initial_balance'])
+            # 실시간 차트 (서버에서 구간별로 집계한 잔고 곡선)
+            chart = status.get('chart')
+            if trade_count > 0 and chart and chart['t']:
+                import plotly.graph_objects as go  # 차트를 그릴 때만 로드
                 
+                # 고가/저가 밴드 위에 종가 선
                 fig = go.Figure()
-                fig.add_trace(go.Scatter(
-                    x=chart_data['time'],
-                    y=chart_data['balance'],
-                    mode='lines+markers',
+                fig.add_trace(go.Scattergl(
+                    x=chart['t'], y=chart['h'], mode='lines',
+                    line=dict(width=0), showlegend=False, hoverinfo='skip'
+                ))
+                fig.add_trace(go.Scattergl(
+                    x=chart['t'], y=chart['l'], mode='lines',
+                    line=dict(width=0), fill='tonexty', fillcolor='rgba(78, 205, 196, 0.2)',
+                    name='구간 범위', hoverinfo='skip'
+                ))
+                x, y = chart['t'], chart['c']
+                
+                # 점이 많으면 마커는 WebGL에서도 비싸므로 선만 그림
+                show_markers = len(y) <= 500
+                
+                fig.add_trace(go.Scattergl(
+                    x=x,
+                    y=y,
+                    mode='lines+markers' if show_markers else 'lines',
                     name='잔고 변화',
-                    line=dict(color='#4ECDC4', width=3),
+                    line=dict(color='#4ECDC4', width=2, shape='linear'),
                     marker=dict(size=4)
                 ))
                 
                 fig.update_layout(
+                    _BASE_LAYOUT,
                     title="💰 실시간 잔고 변화",
-                    xaxis_title="시간",
-                    yaxis_title="잔고 (원)",
-                    template="plotly_white",
-                    height=400
+                    uirevision='balance'  # 자동 새로고침 시 확대/이동 상태 유지
                 )
                 
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(fig, use_container_width=True, config=_CHART_CONFIG)
             
-            # 자동 새로고침 (5초마다)
-            if status.get('status') == 'running':
-                time.sleep(5)
+            # 누적된 거래 기록 중 최근 거래 (최신순)
+            sim_trades = st.session_state.sim_trades
+            if sim_trades:
+                recent = list(islice(reversed(sim_trades), RECENT_TRADE_ROWS))
+                st.dataframe(
+                    pd.DataFrame.from_records(
+                        recent, columns=['timestamp', 'action', 'market_price', 'balance', 'profit_rate', 'ai_confidence']
+                    ),
+                    use_container_width=True,
+                    hide_index=True,
+                    column_config={
+                        'timestamp': st.column_config.DatetimeColumn('시간', format='HH:mm:ss'),
+                        'action': '매매',
+                        'market_price': st.column_config.NumberColumn('시장가', format='%d'),
+                        'balance': st.column_config.NumberColumn('잔고', format='%d'),
+                        'profit_rate': st.column_config.NumberColumn('수익률(%)', format='%+.2f'),
+                        'ai_confidence': st.column_config.NumberColumn('AI 신뢰도', format='%.2f')
+                    }
+                )
+            
+            # 실행 상태가 바뀌면 전체를 한 번 다시 그려 자동 새로고침 여부 갱신
+            running = status_text == 'running'
+            if running != st.session_state.get('simulation_running', True):
+                st.session_state.simulation_running = running
                 st.rerun()
                 
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         st.error("❌ 서버 응답 시간 초과")
     except Exception as e:
         st.error(f"❌ 데이터 조회 실패: {str(e)}")
@@ -321,16 +466,16 @@ def show_backtesting():
     if st.button("🔍 백테스팅 실행", type="secondary"):
         with st.spinner("백테스팅 실행 중..."):
             try:
-                response = requests.post(f"{API_BASE_URL}/simulation/backtest", json={
+                response = post_json(f"{st.session_state.api_base_url}/simulation/backtest", {
                     "strategy": bt_strategy,
                     "symbol": bt_symbol,
                     "start_date": bt_start_date.isoformat() + "T00:00:00",
                     "end_date": bt_end_date.isoformat() + "T23:59:59",
                     "initial_balance": bt_initial_balance
-                }, timeout=15)
+                }, timeout=(1, 15))
                 
                 if response.status_code == 200:
-                    result = response.json()
+                    result = orjson.loads(response.content)
                     
                     # 결과 표시
                     st.success("✅ 백테스팅 완료!")
@@ -369,16 +514,18 @@ def show_trade_history():
     st.subheader("📋 거래 기록")
     
     # 모의 거래 데이터
-    mock_trades = pd.DataFrame({
-        '시간': pd.date_range(start='2024-01-01', periods=20, freq='h'),
-        '거래쌍': ['BTC/KRW'] * 20,
-        '매수/매도': (['매수', '매도'] * 10)[:20],
-        '수량': ([0.001, 0.0015, 0.002] * 7)[:20],
-        '가격': [50000000 + i*100000 for i in range(20)],
-        '손익': ([5000, -3000, 8000, -2000, 12000] * 4)[:20]
-    })
+    mock_trades = _mock_trades()
     
-    st.dataframe(mock_trades, use_container_width=True)
+    st.dataframe(
+        mock_trades,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            '시간': st.column_config.DatetimeColumn(format='YYYY-MM-DD HH:mm'),
+            '가격': st.column_config.NumberColumn(format='%d'),
+            '손익': st.column_config.NumberColumn(format='%+d')
+        }
+    )
     
     # 거래 통계
     col1, col2, col3 = st.columns(3)
@@ -392,16 +539,48 @@ def show_trade_history():
     with col3:
         st.metric("손실 거래", "8회")
 
+@st.cache_data(show_spinner=False)
+def _mock_trades():
+    """모의 거래 데이터 (고정 데이터이므로 한 번만 생성)"""
+    n = 20
+    return pd.DataFrame({
+        '시간': pd.date_range(start='2024-01-01', periods=n, freq='h'),
+        '거래쌍': pd.Categorical.from_codes(np.zeros(n, dtype=np.int8), categories=['BTC/KRW']),
+        '매수/매도': pd.Categorical.from_codes(np.arange(n, dtype=np.int8) % 2, categories=['매수', '매도']),
+        '수량': np.resize([0.001, 0.0015, 0.002], n),
+        '가격': 50_000_000 + np.arange(n) * 100_000,
+        '손익': np.resize([5000, -3000, 8000, -2000, 12000], n)
+    }, copy=False)
+
+async def _get_json_all(urls):
+    """여러 GET 요청을 동시에 전송 (대기 시간 합계 → 최댓값)"""
+    async with httpx.AsyncClient(timeout=httpx.Timeout(5.0, connect=1.0)) as client:
+        responses = await asyncio.gather(*(client.get(url) for url in urls), return_exceptions=True)
+    
+    results = []
+    for response in responses:
+        if isinstance(response, Exception):
+            raise response
+        results.append(orjson.loads(response.content) if response.status_code == 200 else None)
+    return results
+
+@st.cache_data(ttl=5, show_spinner=False)
+def fetch_json_many(urls):
+    """GET 요청 JSON 동시 조회 (탭 전환 등 재실행 시 5초 캐시)"""
+    return asyncio.run(_get_json_all(urls))
+
 def show_system_status():
     """시스템 상태 화면"""
     st.subheader("⚙️ 시스템 상태")
     
     try:
-        # 시스템 정보 조회
-        response = requests.get(f"{API_BASE_URL}/monitoring/system", timeout=5)
-        if response.status_code == 200:
-            system_info = response.json()
-            
+        # 시스템 정보와 헬스체크를 동시에 조회
+        system_info, health = fetch_json_many((
+            f"{st.session_state.api_base_url}/monitoring/system",
+            f"{st.session_state.api_base_url}/monitoring/health"
+        ))
+        
+        if system_info is not None:
             col1, col2 = st.columns(2)
             
             with col1:
@@ -416,41 +595,35 @@ def show_system_status():
                 st.metric("프로세스 CPU", f"{system_info['process']['cpu_percent']:.1f}%")
                 st.metric("프로세스 메모리", f"{system_info['process']['memory_mb']:.1f}MB")
         
-        # 헬스체크
-        response = requests.get(f"{API_BASE_URL}/monitoring/health", timeout=5)
-        if response.status_code == 200:
-            health = response.json()
-            
+        if health is not None:
             st.subheader("🏥 서비스 상태")
             for service, status in health['checks'].items():
-                status_icon = "✅" if status == "healthy" else "⚠️" if status == "not_configured" else "❌"
+                status_icon = _HEALTH_ICON.get(status, "❌")
                 st.write(f"{status_icon} {service}: {status}")
                 
     except Exception as e:
         st.error(f"❌ 시스템 정보 조회 실패: {str(e)}")
 
+@st.cache_data(ttl=60, show_spinner=False)
 def generate_demo_data():
-    """데모 데이터 생성"""
+    """데모 데이터 생성 (1분 캐시 - 재실행마다 새로 만들지 않음)"""
     times = pd.date_range(start=datetime.now() - timedelta(hours=24), periods=50, freq='30min')
     base_balance = 1000000
-    changes = np.random.randn(50).cumsum() * 5000
+    changes = _RNG.standard_normal(50).cumsum() * 5000
     balances = base_balance + changes
     
-    return pd.DataFrame({
-        'time': times,
+    return {
+        'time': times.to_numpy(),
         'balance': balances
-    })
+    }
 
-def generate_mock_chart_data(trade_count, initial_balance):
-    """모의 차트 데이터 생성"""
-    times = pd.date_range(start=datetime.now() - timedelta(hours=1), periods=trade_count, freq='2min')
-    changes = np.random.randn(trade_count).cumsum() * 2000
-    balances = initial_balance + changes
-    
-    return pd.DataFrame({
-        'time': times,
-        'balance': balances
-    })
+# 화면 이름 → (렌더링 함수, 오류 메시지 접두어)
+_TABS = {
+    "📊 실시간 모니터링": (show_realtime_monitoring, "실시간 모니터링"),
+    "📈 백테스팅": (show_backtesting, "백테스팅"),
+    "📋 거래 기록": (show_trade_history, "거래 기록"),
+    "⚙️ 시스템 상태": (show_system_status, "시스템 상태")
+}
 
 if __name__ == "__main__":
     main()